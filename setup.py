@@ -9,8 +9,12 @@ setup(
     packages=find_packages(),
     install_requires=[
     ],
+    extras_require={
+        "numba": ["numba>=0.57"],
+    },
     keywords=["tax", "india", "income tax", "tax calculation"],
     long_description=open("README.md").read(),
     long_description_content_type="text/markdown",
-    url="https://github.com/amrajacivil/taxcalcindia"
+    url="https://github.com/amrajacivil/taxcalcindia",
+    python_requires=">=3.10"
 )
\ No newline at end of file
@@ -1,5 +1,6 @@
 from .calculator import (
-    IncomeTaxCalculator
+    IncomeTaxCalculator,
+    calculate_tax_batch
 )
 from .exceptions import (
     TaxCalculationException
@@ -10,7 +11,8 @@ from .models import (
     CapitalGainsIncome,
     BusinessIncome,
     OtherIncome,
-    Deductions
+    Deductions,
+    ModelBatch
 )   
 
 __all__ = [
@@ -21,5 +23,7 @@ __all__ = [
     "BusinessIncome",
     "OtherIncome",
     "Deductions",
-    "IncomeTaxCalculator"
+    "ModelBatch",
+    "IncomeTaxCalculator",
+    "calculate_tax_batch"
 ]
\ No newline at end of file
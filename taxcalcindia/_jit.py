@@ -0,0 +1,43 @@
+"""numba-compiled copies of the kernels in _kernels, used by the batch paths.
+
+Imported lazily through _kernels.batch_kernels(); importing this module
+requires numba and numpy.
+"""
+
+import math
+import types
+
+import numpy as np
+from numba import njit, prange
+
+from . import _kernels
+
+
+def as_float_array(values):
+  """Pack numbers into a float64 ndarray for the compiled kernels."""
+  return np.asarray(values, dtype=np.float64)
+
+
+def as_float_matrix(rows):
+  """Two-dimensional counterpart of as_float_array; rows must share a length."""
+  return np.asarray(rows, dtype=np.float64)
+
+
+def float_zeros(n):
+  """Return a zero-filled float64 output buffer of length ``n``."""
+  return np.zeros(n, dtype=np.float64)
+
+
+def _compile_kernels():
+  # each kernel is copied onto a namespace that holds the compiled copies, so
+  # compiled kernels call each other while the plain ones in _kernels stay as they are
+  namespace = {"__name__": __name__, "math": math, "prange": prange}
+  for name in _kernels.KERNEL_NAMES:
+    func = getattr(_kernels, name)
+    copy = types.FunctionType(func.__code__, namespace, name, func.__defaults__)
+    copy.__doc__ = func.__doc__
+    namespace[name] = njit(cache=True, parallel=name in _kernels.PARALLEL_KERNELS)(copy)
+  return {name: namespace[name] for name in _kernels.KERNEL_NAMES}
+
+
+globals().update(_compile_kernels())
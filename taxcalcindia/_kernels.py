@@ -0,0 +1,220 @@
+"""Numeric kernels shared by the calculator.
+
+The kernels here are plain Python and are what the single-taxpayer calculator
+runs, so importing the package never loads numba. The batch paths go through
+batch_kernels(), which returns numba-compiled copies of the same functions
+when numba is installed (``pip install taxcalcindia[numba]``) and this module
+otherwise, so results never depend on which path is taken.
+"""
+
+import math
+import sys
+
+# numba.prange in the compiled copies
+prange = range
+
+# kernels compiled by batch_kernels(); PARALLEL_KERNELS are compiled with parallel=True
+KERNEL_NAMES = (
+  "calc_tax", "calc_slab_taxes", "round2", "surcharge_rate", "regime_tax",
+  "first_invalid_row", "_tax_batch_row", "tax_batch", "tax_batch_parallel",
+  "cap_column", "add_scaled_column", "capped_row_sums",
+)
+PARALLEL_KERNELS = frozenset({"tax_batch_parallel"})
+
+_batch_kernels = None
+
+
+def batch_kernels():
+  """Return the kernels and containers for the batch paths.
+
+  The numba-compiled namespace (taxcalcindia._jit) is imported on first use
+  when numba is installed; otherwise this module is returned.
+  """
+  global _batch_kernels
+  if _batch_kernels is None:
+    try:
+      from . import _jit as kernels
+    except ImportError:
+      kernels = sys.modules[__name__]
+    _batch_kernels = kernels
+  return _batch_kernels
+
+
+def as_float_array(values):
+  """Pack numbers into a tuple of floats for the kernels."""
+  return tuple(float(value) for value in values)
+
+
+def as_float_matrix(rows):
+  """Two-dimensional counterpart of as_float_array; rows must share a length."""
+  return tuple(as_float_array(row) for row in rows)
+
+
+def float_zeros(n):
+  """Return a zero-filled output buffer of length ``n`` for the kernels."""
+  return [0.0] * n
+
+
+def calc_tax(taxable, limits, rates):
+  """Return the slab tax on ``taxable`` for slab upper ``limits`` and ``rates``."""
+  tax = 0.0
+  previous_limit = 0.0
+  for i in range(len(limits)):
+    if taxable <= previous_limit:
+      break
+    limit = limits[i]
+    slab_end = limit if limit < taxable else taxable
+    tax += (slab_end - previous_limit) * rates[i]
+    previous_limit = limit
+  return tax
+
+
+def calc_slab_taxes(taxable, limits, rates, out):
+  """Write the tax charged in each slab into ``out`` and return how many slabs were reached."""
+  previous_limit = 0.0
+  for i in range(len(limits)):
+    if taxable <= previous_limit:
+      return i
+    limit = limits[i]
+    slab_end = limit if limit < taxable else taxable
+    out[i] = (slab_end - previous_limit) * rates[i]
+    previous_limit = limit
+  return len(limits)
+
+
+def round2(value):
+  """Round to 2 decimals exactly like the built-in ``round(value, 2)``.
+
+  Needed by the compiled copies: numba's round() scales by 100 first, so a
+  product that lands on .5 after rounding is resolved the wrong way. The exact product error (Dekker's
+  two-product) tells which side of the tie the real value is on.
+  """
+  scaled = value * 100.0
+  if not abs(scaled) < 2.0 ** 51:
+    return value
+  split = 134217729.0 * value
+  value_hi = split - (split - value)
+  value_lo = value - value_hi
+  error = (value_hi * 100.0 - scaled) + value_lo * 100.0
+  whole = math.floor(scaled)
+  fraction = scaled - whole
+  if fraction > 0.5 or (fraction == 0.5 and (error > 0.0 or (error == 0.0 and whole % 2 == 1))):
+    whole += 1.0
+  return whole / 100.0
+
+
+def surcharge_rate(taxable, is_new):
+  """Return the surcharge rate in percent for the given taxable income."""
+  if taxable <= 5000000:
+    return 0
+  if taxable <= 10000000:
+    return 10
+  if taxable <= 20000000:
+    return 15
+  if taxable <= 50000000:
+    return 25
+  return 25 if is_new else 37
+
+
+def regime_tax(taxable, limits, rates, rebate_limit, is_new, special_income, special_tax):
+  """Return the final tax (slab tax, surcharge and 4% cess) rounded up to the rupee.
+
+  ``special_income`` is the part of ``taxable`` taxed at flat rates (special
+  rate capital gains) and ``special_tax`` the flat tax on it. As in the
+  calculator, that income counts towards the rebate limit but is left out of
+  the slabs and of the surcharge bracket.
+  """
+  slab_income = taxable - special_income
+  base_tax = calc_tax(slab_income, limits, rates) if taxable > rebate_limit else 0.0
+  base_tax += special_tax
+  surcharge = round2(base_tax * (surcharge_rate(slab_income, is_new) / 100.0))
+  tax_after_surcharge = base_tax + surcharge
+  cess = round2(tax_after_surcharge * 0.04)
+  return math.ceil(round2(tax_after_surcharge + cess))
+
+
+def first_invalid_row(incomes, ages, deductions, min_age, max_age):
+  """Return the index of the first row the calculator would reject, or -1 if there is none.
+
+  A row is rejected for a negative, NaN or infinite income or deduction, or an
+  age that is not a whole number from ``min_age`` to ``max_age``.
+  """
+  for i in range(len(incomes)):
+    age = ages[i]
+    if not (
+      0 <= incomes[i] < math.inf
+      and 0 <= deductions[i] < math.inf
+      and min_age <= age <= max_age
+      and age == math.floor(age)
+    ):
+      return i
+  return -1
+
+
+def _tax_batch_row(i, incomes, ages, deductions, new_regime, old_regime, new_tax, old_tax):
+  new_limits, new_rates, new_standard_deduction, new_rebate_limit = new_regime
+  old_limits, old_rates, old_standard_deduction, old_rebate_limit = old_regime
+  income = incomes[i]
+  slab_idx = int(ages[i] >= 60) + int(ages[i] >= 80)
+  new_tax[i] = regime_tax(
+    max(income - new_standard_deduction, 0.0), new_limits, new_rates, new_rebate_limit, True, 0.0, 0.0
+  )
+  old_tax[i] = regime_tax(
+    max(income - old_standard_deduction - deductions[i], 0.0),
+    old_limits[slab_idx], old_rates[slab_idx], old_rebate_limit, False, 0.0, 0.0
+  )
+
+
+def tax_batch(incomes, ages, deductions, new_regime, old_regime, new_tax, old_tax):
+  """Fill ``new_tax``/``old_tax`` row by row for salaried taxpayers."""
+  for i in range(len(incomes)):
+    _tax_batch_row(i, incomes, ages, deductions, new_regime, old_regime, new_tax, old_tax)
+
+
+def tax_batch_parallel(incomes, ages, deductions, new_regime, old_regime, new_tax, old_tax):
+  """Same as tax_batch, with rows spread across threads by numba."""
+  for i in prange(len(incomes)):
+    _tax_batch_row(i, incomes, ages, deductions, new_regime, old_regime, new_tax, old_tax)
+
+
+def cap_column(values, cap, out):
+  """Copy ``values`` into ``out`` clipped to ``cap``.
+
+  Returns the index of the first negative or NaN value, or -1 if there is none.
+  """
+  for i in range(len(values)):
+    value = values[i]
+    # written so NaN (a missing value in pandas) fails too instead of becoming the cap
+    if not value >= 0:
+      return i
+    out[i] = value if value < cap else cap
+  return -1
+
+
+def add_scaled_column(total, column, weight):
+  """Add ``column * weight`` into ``total`` element-wise."""
+  for i in range(len(column)):
+    total[i] += column[i] * weight
+
+
+def capped_row_sums(rows, caps, weights, out):
+  """Write each row's sum of ``min(value, cap) * weight`` into ``out``.
+
+  Returns the index of the first row holding a negative or NaN value, or -1 if there is none.
+  """
+  for i in range(len(rows)):
+    row = rows[i]
+    total = 0.0
+    for j in range(len(caps)):
+      value = row[j]
+      # as in cap_column, NaN must fail rather than become the cap
+      if not value >= 0:
+        return i
+      weight = weights[j]
+      if weight == 0.0:
+        # skipped rather than added as 0: an infinite amount times 0 is NaN
+        continue
+      cap = caps[j]
+      total += (value if value < cap else cap) * weight
+    out[i] = total
+  return -1
@@ -1,6 +1,7 @@
-from .models import SalaryIncome,CapitalGainsIncome,BusinessIncome,OtherIncome,Deductions,TaxSettings,EmploymentType
-from .slabs import get_tax_slabs
-import pprint
+from .models import SalaryIncome,CapitalGainsIncome,BusinessIncome,OtherIncome,Deductions,TaxSettings,EmploymentType,SECTION_80TTA_CAP,SECTION_80TTB_CAP,_cap_nonneg,SUPPORTED_AGES,_CG_TAX_RATES
+from .exceptions import TaxCalculationException
+from .slabs import get_tax_slabs, get_tax_arrays
+from ._kernels import calc_tax, calc_slab_taxes, surcharge_rate, regime_tax, float_zeros, batch_kernels
 import math
 
 
@@ -8,6 +9,8 @@ NEW_REGIME_KEY="new_regime"
 OLD_REGIME_GEN_KEY="old_regime_general"
 OLD_REGIME_SEN_KEY="old_regime_senior"
 OLD_REGIME_SUPER_SEN_KEY="old_regime_super_senior"
+# old regime slab keys indexed by (age >= 60) + (age >= 80)
+OLD_REGIME_KEYS=(OLD_REGIME_GEN_KEY, OLD_REGIME_SEN_KEY, OLD_REGIME_SUPER_SEN_KEY)
 
 NEW_REGIME_STANDARD_DEDUCTION=75000
 OLD_REGIME_STANDARD_DEDUCTION=50000
@@ -47,6 +50,9 @@ class IncomeTaxCalculator:
       ):
     """Validate input parameters for the tax calculator.
 
+    The type checks are skipped when Python runs with -O; the income source
+    check always runs.
+
     Args:
         settings (TaxSettings): Tax settings for the individual.
         salary (SalaryIncome | None): Salary income details.
@@ -63,28 +69,73 @@ class IncomeTaxCalculator:
         TypeError: If other_income is not an OtherIncome object.
         TypeError: If deductions is not a Deductions object.
     """      
-    if not isinstance(settings, TaxSettings):
-        raise TypeError("settings must be TaxSettings object")
+    # type checks guard against caller mistakes only; they are skipped under python -O
+    if __debug__:
+      if not isinstance(settings, TaxSettings):
+          raise TypeError("settings must be TaxSettings object")
 
-    if not any([salary,business,other_income]):
+    if not (salary or business or other_income):
       raise ValueError(
           "atleast one income source (salary, business, or other_income) is required"
       )
 
-    if salary and not isinstance(salary, SalaryIncome):
-        raise TypeError("salary must be SalaryIncome object")
+    if __debug__:
+      if salary and not isinstance(salary, SalaryIncome):
+          raise TypeError("salary must be SalaryIncome object")
+
+      if capital_gains and not isinstance(capital_gains, CapitalGainsIncome):
+          raise TypeError("capital_gains must be CapitalGainsIncome object")
+
+      if business and not isinstance(business, BusinessIncome):
+          raise TypeError("business must be BusinessIncome object")
 
-    if capital_gains and not isinstance(capital_gains, CapitalGainsIncome):
-        raise TypeError("capital_gains must be CapitalGainsIncome object")
+      if other_income and not isinstance(other_income, OtherIncome):
+          raise TypeError("other_income must be OtherIncome object")
 
-    if business and not isinstance(business, BusinessIncome):
-        raise TypeError("business must be BusinessIncome object")
+      if deductions and not isinstance(deductions, Deductions):
+          raise TypeError("deductions must be Deductions object")
 
-    if other_income and not isinstance(other_income, OtherIncome):
-        raise TypeError("other_income must be OtherIncome object")
+  @staticmethod
+  def make_tax_fn(financial_year: int, age: int):
+    """Build a tax function specialised for one financial year and age.
 
-    if deductions and not isinstance(deductions, Deductions):
-        raise TypeError("deductions must be Deductions object")
+    Slab lookup and age bucketing are resolved once, so the returned function
+    only runs the tax kernels. Useful when scoring many incomes for the same
+    (financial_year, age).
+
+    Args:
+        financial_year (int): Financial year for tax calculation.
+        age (int): Age of the taxpayer.
+
+    Raises:
+        TaxCalculationException: If the age or financial year is invalid.
+
+    Returns:
+        Callable[..., tuple]: Maps (new_regime_taxable_income, old_regime_taxable_income,
+        capital_gains=None) to (new_regime_tax, old_regime_tax), rounded up to the rupee.
+        The taxable incomes are the ones calculate_tax reports, which include
+        capital gains; pass the same CapitalGainsIncome so its special rate
+        gains are taxed at their flat rates rather than the slabs, and the
+        result matches the calculate_tax totals.
+    """
+    settings = TaxSettings(age=age, financial_year=financial_year)
+    new_limits, new_rates = get_tax_arrays(settings.financial_year, NEW_REGIME_KEY)
+    old_limits, old_rates = get_tax_arrays(
+      settings.financial_year, OLD_REGIME_KEYS[(settings.age >= 60) + (settings.age >= 80)]
+    )
+    new_rebate_limit = float(NEW_TAX_REGIME_REBATE_LIMIT)
+    old_rebate_limit = float(OLD_TAX_REGIME_REBATE_LIMIT)
+
+    def tax_fn(new_taxable_income, old_taxable_income, capital_gains: CapitalGainsIncome | None = None):
+      special_income = special_tax = 0.0
+      if capital_gains is not None:
+        special_income = float(sum(getattr(capital_gains, name) for name, _ in _CG_TAX_RATES))
+        special_tax = float(capital_gains.total_capital_gains_tax)
+      return (
+        regime_tax(float(new_taxable_income), new_limits, new_rates, new_rebate_limit, True, special_income, special_tax),
+        regime_tax(float(old_taxable_income), old_limits, old_rates, old_rebate_limit, False, special_income, special_tax),
+      )
+    return tax_fn
 
   @property
   def gross_income(self):
@@ -105,10 +156,10 @@ class IncomeTaxCalculator:
     """Calculate the total deductions for the individual."""
     if self.other_income and hasattr(self.other_income,'savings_account_interest'):
       if self.settings.age>60:
-        self.deductions.section_80ttb=self.other_income.savings_account_interest
+        self.deductions.section_80ttb=_cap_nonneg(self.other_income.savings_account_interest,SECTION_80TTB_CAP,"section_80ttb")
         self.deductions.section_80tta=0
       else:
-        self.deductions.section_80tta=self.other_income.savings_account_interest
+        self.deductions.section_80tta=_cap_nonneg(self.other_income.savings_account_interest,SECTION_80TTA_CAP,"section_80tta")
         self.deductions.section_80ttb=0
 
     #section_80ddb
@@ -118,9 +169,9 @@ class IncomeTaxCalculator:
       self.deductions.section_80ddb=min(self.deductions.section_80ddb,40000)
 
     #section_80ccd_2
-    if self.settings.employment_type == EmploymentType.GOVERNMENT:
+    if self.settings.employment_type is EmploymentType.GOVERNMENT:
       self.deductions.section_80ccd_2 = min(self.deductions.section_80ccd_2, self.salary.basic_and_da * 0.14)
-    elif self.settings.employment_type == EmploymentType.PRIVATE:
+    elif self.settings.employment_type is EmploymentType.PRIVATE:
       self.deductions.section_80ccd_2 = min(self.deductions.section_80ccd_2, self.salary.basic_and_da * 0.10)
     else:
       self.deductions.section_80ccd_2 = 0
@@ -135,46 +186,35 @@ class IncomeTaxCalculator:
 
 
   def __calculate_hra_component_for_private(self):
-    if self.settings.employment_type == EmploymentType.PRIVATE:
+    if self.settings.employment_type is EmploymentType.PRIVATE:
       hra = min(self.salary.hra, self.salary.basic_and_da * 0.5,self.deductions.rent_for_hra_exemption-0.1*self.salary.basic_and_da)
       return hra
     return 0
 
   def __calculate_hra_component_for_self_employed(self):
-    if self.settings.employment_type == EmploymentType.SELF_EMPLOYED:
+    if self.settings.employment_type is EmploymentType.SELF_EMPLOYED:
       return min(5000,0.25*self.gross_income,0.1*self.salary.basic_and_da)
     return 0
 
 
-  def __get_taxable_income(self):
-    if self.settings.employment_type==EmploymentType.SELF_EMPLOYED:
-      old_regime_taxable_income=max(0, self.gross_income  - self.total_deductions)
-      new_regime_taxable_income=max(0, self.gross_income)
+  def __get_taxable_income(self, gross_income):
+    if self.settings.employment_type is EmploymentType.SELF_EMPLOYED:
+      old_regime_taxable_income=max(0, gross_income  - self.total_deductions)
+      new_regime_taxable_income=max(0, gross_income)
       return new_regime_taxable_income, old_regime_taxable_income
     
     if (not self._has_salary) or (getattr(self.salary, "total", 0) == 0):
-      old_regime_taxable_income = max(0, self.gross_income - self.total_deductions)
-      new_regime_taxable_income = max(0, self.gross_income)
+      old_regime_taxable_income = max(0, gross_income - self.total_deductions)
+      new_regime_taxable_income = max(0, gross_income)
     else:
-      old_regime_taxable_income=max(0, self.gross_income - OLD_REGIME_STANDARD_DEDUCTION - self.total_deductions)
-      new_regime_taxable_income=max(0, self.gross_income - NEW_REGIME_STANDARD_DEDUCTION)
+      old_regime_taxable_income=max(0, gross_income - OLD_REGIME_STANDARD_DEDUCTION - self.total_deductions)
+      new_regime_taxable_income=max(0, gross_income - NEW_REGIME_STANDARD_DEDUCTION)
     return new_regime_taxable_income, old_regime_taxable_income
   
   def __calculate_surcharge(self, taxable_income, regime_type, tax_amount=0):
     ti = float(taxable_income)
-    def get_rate(ti_value: float, is_new: bool) -> int:
-      if ti_value <= 5000000:
-        return 0
-      if ti_value <= 10000000:
-        return 10
-      if ti_value <= 20000000:
-        return 15
-      if ti_value <= 50000000:
-        return 25
-      return 25 if is_new else 37
-
-    old_rate = get_rate(ti, is_new=False)
-    new_rate = get_rate(ti, is_new=True)
+    old_rate = surcharge_rate(ti, False)
+    new_rate = surcharge_rate(ti, True)
 
     def calc_amount(rate: int):
       return round(float(tax_amount) * (rate / 100.0), 2)
@@ -191,25 +231,25 @@ class IncomeTaxCalculator:
 
 
 
-  def __calculate_tax_per_slab(self,taxable_income,slab):
-    tax = 0.0
+  def __calculate_tax_per_slab(self,taxable_income,slab,slab_columns,is_tax_per_slab_needed=False):
     tax_per_slab = {}
     if taxable_income <= 0:
-      return tax, tax_per_slab
-
-    remaining = float(taxable_income)
-    previous_limit = 0.0
-    for limit, rate in slab:
-      if remaining <= 0:
-        break
-      slab_end = limit if limit != float("inf") else taxable_income
-      taxable_in_slab = min(slab_end - previous_limit, remaining)
-      slab_tax = taxable_in_slab * rate
-      tax += slab_tax
-      tax_per_slab[(previous_limit, min(slab_end, taxable_income))] = slab_tax
-      remaining -= taxable_in_slab
-      previous_limit = limit
-    return tax, tax_per_slab
+      return 0.0, tax_per_slab
+
+    limits, rates = slab_columns
+    if not is_tax_per_slab_needed:
+      return calc_tax(float(taxable_income), limits, rates), tax_per_slab
+
+    slab_taxes = float_zeros(len(slab))
+    reached = calc_slab_taxes(float(taxable_income), limits, rates, slab_taxes)
+    # keys are (lower, upper) income bounds of each slab reached, with the
+    # open-ended top slab cut off at the taxable income
+    previous_limits = (0.0,) + tuple(limit for limit, _ in slab)
+    tax_per_slab = {
+      (previous_limits[i], min(slab[i][0], taxable_income)): float(slab_taxes[i])
+      for i in range(reached)
+    }
+    return sum(tax_per_slab.values()), tax_per_slab
 
   def __stringify_keys(self,obj):
     if isinstance(obj, dict):
@@ -223,7 +263,7 @@ class IncomeTaxCalculator:
         return [self.__stringify_keys(i) for i in obj]
     return obj
   
-  def __compute_regime_tax(self, taxable_income: float, slab, rebate_limit: float, regime_type: str, apply_deduction: float = 0.0):
+  def __compute_regime_tax(self, taxable_income: float, slab, slab_columns, rebate_limit: float, regime_type: str, apply_deduction: float = 0.0, is_tax_per_slab_needed: bool = False):
     """Compute tax, surcharge, and cess for a given regime. Returns a dict with components."""
     if taxable_income > rebate_limit:
       is_income_above_rebate=True
@@ -236,7 +276,7 @@ class IncomeTaxCalculator:
                     + self.capital_gains.long_term_at_20_percent)
       
     if is_income_above_rebate:
-      base_tax, tax_per_slab = self.__calculate_tax_per_slab(taxable_income, slab)
+      base_tax, tax_per_slab = self.__calculate_tax_per_slab(taxable_income, slab, slab_columns, is_tax_per_slab_needed)
     else:
       base_tax, tax_per_slab = 0.0, {}
       
@@ -266,58 +306,44 @@ class IncomeTaxCalculator:
     Args:
         is_comparision_needed (bool, optional): Whether to include tax regime comparison. Defaults to True.
         is_tax_per_slab_needed (bool, optional): Whether to include tax per slab details. Defaults to False.
+        display_result (bool, optional): Whether to pretty-print the result to stdout. Defaults to False.
 
     Returns:
         dict: A dictionary containing the tax calculation results.
     """
     slabs = get_tax_slabs(self.settings.financial_year, self.settings.age)
-    new_taxable, old_taxable = self.__get_taxable_income()
-    if self.settings.age >= 80:
-      old_slab_key = OLD_REGIME_SUPER_SEN_KEY
-    elif self.settings.age >= 60:
-      old_slab_key = OLD_REGIME_SEN_KEY
-    else:
-      old_slab_key = OLD_REGIME_GEN_KEY
+    gross_income = self.gross_income
+    new_taxable, old_taxable = self.__get_taxable_income(gross_income)
+    age = self.settings.age
+    old_slab_key = OLD_REGIME_KEYS[(age >= 60) + (age >= 80)]
 
     # compute new and old regime totals using helper
     new_result = self.__compute_regime_tax(
       taxable_income=new_taxable,
       slab=slabs[NEW_REGIME_KEY],
+      slab_columns=get_tax_arrays(self.settings.financial_year, NEW_REGIME_KEY),
       rebate_limit=NEW_TAX_REGIME_REBATE_LIMIT,
       regime_type="new",
-      apply_deduction=0.0
+      apply_deduction=0.0,
+      is_tax_per_slab_needed=is_tax_per_slab_needed
     )
 
     old_result = self.__compute_regime_tax(
       taxable_income=old_taxable,
       slab=slabs[old_slab_key],
+      slab_columns=get_tax_arrays(self.settings.financial_year, old_slab_key),
       rebate_limit=OLD_TAX_REGIME_REBATE_LIMIT,
       regime_type="old",
-      apply_deduction=0.0
+      apply_deduction=0.0,
+      is_tax_per_slab_needed=is_tax_per_slab_needed
     )
 
-    # recommendation and savings
     new_tax_total = new_result["total_tax"]
     old_tax_total = old_result["total_tax"]
 
-    if new_tax_total > old_tax_total:
-      recommended = "old"
-      savings = round(new_tax_total - old_tax_total)
-      summary = f"Old tax regime results in a savings of ₹{savings} compared to the new regime"
-    else:
-      recommended = "new"
-      savings = round(old_tax_total - new_tax_total)
-      summary = f"New tax regime results in a savings of ₹{savings} compared to the old regime"
-
-    recommendation = {
-      "recommended_regime": recommended,
-      "summary": summary,
-      "tax_savings_amount": savings
-    }
-
     result = {
       "income_summary": {
-        "gross_income": self.gross_income,
+        "gross_income": gross_income,
         "gross_deductions": self.deductions.total,
         "new_regime_taxable_income": new_taxable,
         "old_regime_taxable_income": old_taxable
@@ -342,8 +368,16 @@ class IncomeTaxCalculator:
         }
       }
 
+    # recommendation and savings
     if is_comparision_needed:
-      result["tax_regime_comparison"] = recommendation
+      tax_difference = new_tax_total - old_tax_total
+      recommended, other = ("old", "new") if tax_difference > 0 else ("new", "old")
+      savings = round(abs(tax_difference))
+      result["tax_regime_comparison"] = {
+        "recommended_regime": recommended,
+        "summary": f"{recommended.title()} tax regime results in a savings of ₹{savings} compared to the {other} regime",
+        "tax_savings_amount": savings
+      }
 
     if is_tax_per_slab_needed:
       result["tax_per_slabs"] = {
@@ -352,7 +386,65 @@ class IncomeTaxCalculator:
       }
     result = self.__stringify_keys(result)
     if display_result:
+      # imported here so library use without display never loads pprint
+      import pprint
       pprint.pprint(result, indent=2, sort_dicts=False)
     return result
 
 
+def calculate_tax_batch(incomes, ages, deductions, financial_year: int = 2025, parallel: bool = True):
+  """Calculate new and old regime tax for many salaried taxpayers at once.
+
+  Each row is treated like an IncomeTaxCalculator run for a private-sector
+  employee with only salary income: the standard deduction applies, and
+  ``deductions`` is the row's total old regime deduction. The returned totals
+  match ``calculate_tax()["tax_liability"][regime]["total"]``.
+
+  Args:
+      incomes (Sequence[float]): Gross salary income per taxpayer.
+      ages (Sequence[int]): Age per taxpayer, used to pick the old regime slab.
+      deductions (Sequence[float]): Total old regime deductions per taxpayer.
+      financial_year (int, optional): Financial year for tax calculation. Defaults to 2025.
+      parallel (bool, optional): Spread rows across threads when numba is installed. Defaults to True.
+
+  Raises:
+      ValueError: If the input sequences differ in length.
+      TaxCalculationException: If a row has a negative or missing (NaN) income
+          or deduction, or an age IncomeTaxCalculator would reject.
+      DataNotFoundError: If the financial year is not supported.
+
+  Returns:
+      tuple: (new_regime_tax, old_regime_tax), as float64 arrays when numba is
+      installed and lists otherwise.
+  """
+  if not (len(incomes) == len(ages) == len(deductions)):
+    raise ValueError("incomes, ages and deductions must have the same length")
+  # pad the old regime slabs to a common length so they can be indexed by age bucket;
+  # the padding repeats the open-ended top slab and never taxes anything
+  old_columns = [get_tax_arrays(financial_year, key) for key in OLD_REGIME_KEYS]
+  width = max(len(limits) for limits, _ in old_columns)
+  old_limits, old_rates = [], []
+  for limits, rates in old_columns:
+    old_limits.append(list(limits) + [limits[-1]] * (width - len(limits)))
+    old_rates.append(list(rates) + [rates[-1]] * (width - len(rates)))
+  kernels = batch_kernels()
+  old_limits, old_rates = kernels.as_float_matrix(old_limits), kernels.as_float_matrix(old_rates)
+
+  new_limits, new_rates = (kernels.as_float_array(column) for column in get_tax_arrays(financial_year, NEW_REGIME_KEY))
+  new_regime = (new_limits, new_rates, float(NEW_REGIME_STANDARD_DEDUCTION), float(NEW_TAX_REGIME_REBATE_LIMIT))
+  old_regime = (old_limits, old_rates, float(OLD_REGIME_STANDARD_DEDUCTION), float(OLD_TAX_REGIME_REBATE_LIMIT))
+
+  incomes, ages, deductions = (kernels.as_float_array(column) for column in (incomes, ages, deductions))
+  invalid_at = kernels.first_invalid_row(
+    incomes, ages, deductions, float(SUPPORTED_AGES[0]), float(SUPPORTED_AGES[-1])
+  )
+  if invalid_at >= 0:
+    raise TaxCalculationException(
+      f"row {invalid_at}: income and deductions must be non-negative numbers and age a whole number "
+      f"from {SUPPORTED_AGES[0]} to {SUPPORTED_AGES[-1]} (got income={float(incomes[invalid_at])}, "
+      f"age={float(ages[invalid_at])}, deductions={float(deductions[invalid_at])})"
+    )
+  new_tax, old_tax = kernels.float_zeros(len(incomes)), kernels.float_zeros(len(incomes))
+  kernel = kernels.tax_batch_parallel if parallel else kernels.tax_batch
+  kernel(incomes, ages, deductions, new_regime, old_regime, new_tax, old_tax)
+  return new_tax, old_tax
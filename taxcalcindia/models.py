@@ -1,8 +1,24 @@
 """Models for tax calculation in India"""
 
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from functools import lru_cache
+import math
+from ._kernels import batch_kernels
 from .exceptions import TaxCalculationException
-from typing import Any
+from .slabs import SUPPORTED_FINANCIAL_YEARS
+from typing import Any, Mapping, Sequence, Tuple
+
+SUPPORTED_AGES = range(18, 101)
+# built once at import for O(1) membership checks in TaxSettings
+_VALID_AGES = frozenset(SUPPORTED_AGES)
+_VALID_YEARS = frozenset(SUPPORTED_FINANCIAL_YEARS)
+_ERR_AGE = "invalid age"
+_ERR_YEAR = "module does not support tax calculation for financial years prior to 2025"
+SECTION_80TTA_CAP = 10000
+SECTION_80TTB_CAP = 50000
+# share of HRA eligible for exemption, indexed by TaxSettings.is_metro_resident
+_HRA_FACTORS = (0.4, 0.5)
 
 def _validate_non_negative(name: str, value: Any):
     """Normalize None to 0, ensure numeric and non-negative."""
@@ -21,6 +37,81 @@ def _validate_non_negative(name: str, value: Any):
     return int(val) if float(val).is_integer() else val
 
 
+def _cap_nonneg(value: Any, cap, name: str):
+    """Validate ``value`` like _validate_non_negative and clamp it to ``cap``."""
+    value = _validate_non_negative(name, value)
+    return cap if value > cap else value
+
+
+@lru_cache(maxsize=None)
+def _amount_fields(model: type) -> Tuple[Tuple[str, Any], ...]:
+    """Return (name, cap) for every init field of a model dataclass.
+
+    cap comes from the field's metadata and is math.inf for uncapped fields,
+    so callers can clamp every field the same way.
+    Resolved once per class instead of walking fields() per instance.
+    """
+    return tuple((f.name, f.metadata.get("cap", math.inf)) for f in fields(model) if f.init)
+
+
+def _validate_amount_fields(obj):
+    """Run _validate_non_negative over every init field of a model dataclass.
+
+    Fields declared with a ``cap`` in their metadata are clamped to it in the
+    same pass. Uses object.__setattr__ so it also works on frozen dataclasses.
+    """
+    for name, cap in _amount_fields(type(obj)):
+        value = getattr(obj, name)
+        # ints already in range are what _validate_non_negative would return;
+        # leave them in place rather than paying for the call and the store
+        if type(value) is int and 0 <= value <= cap:
+            continue
+        value = _validate_non_negative(name, value)
+        if value > cap:
+            value = cap
+        object.__setattr__(obj, name, value)
+
+
+def _batch_from_arrays(model: type, arrays: Mapping[str, Sequence[float]], totals: Mapping[str, Sequence[tuple]]) -> "ModelBatch":
+    """Build a ModelBatch for ``model`` from per-field columns.
+
+    Missing columns default to zeros, every column is checked for negative
+    or NaN values and clamped to the field's ``cap``, and each entry in ``totals``
+    (name -> ((field, weight), ...)) becomes a weighted column sum.
+    """
+    amount_fields = _amount_fields(model)
+    unknown = set(arrays) - {name for name, _ in amount_fields}
+    if unknown:
+        raise TypeError(f"{model.__name__}.from_arrays() got unexpected fields: {', '.join(sorted(unknown))}")
+    lengths = {len(values) for values in arrays.values()}
+    if len(lengths) > 1:
+        raise ValueError("all columns must have the same length")
+    n = lengths.pop() if lengths else 0
+
+    kernels = batch_kernels()
+    columns = {}
+    for name, cap in amount_fields:
+        column = kernels.float_zeros(n)
+        if name in arrays:
+            try:
+                values = kernels.as_float_array(arrays[name])
+            except (TypeError, ValueError):
+                # same exception as the constructor gives for a non-numeric field
+                raise TaxCalculationException(f"{name} must be a number") from None
+            negative_at = kernels.cap_column(values, float(cap), column)
+            if negative_at >= 0:
+                raise TaxCalculationException(f"{name} in row {negative_at} must be a non-negative number")
+        columns[name] = column
+
+    total_columns = {}
+    for name, weights in totals.items():
+        total = kernels.float_zeros(n)
+        for field_name, weight in weights:
+            kernels.add_scaled_column(total, columns[field_name], weight)
+        total_columns[name] = total
+    return ModelBatch(model, columns, total_columns)
+
+
 class EmploymentType(Enum):
   """Employment type of the taxpayer.
 
@@ -32,365 +123,494 @@ class EmploymentType(Enum):
   SELF_EMPLOYED = "self_employed"
 
 
+# eq=False on the models keeps the identity equality and hashing the
+# hand-written classes had
+@dataclass(frozen=True, slots=True, eq=False)
 class TaxSettings:
   """Tax settings for an individual taxpayer.
-  """  
-  def __init__(self, age: int, financial_year: int = 2025, is_metro_resident: bool = True, employment_type: EmploymentType = EmploymentType.PRIVATE):
-    """Initialize tax settings for an individual taxpayer.
-
-    Args:
-        age (int): Age of the taxpayer.
-        financial_year (int): Financial year for tax calculation.
-        is_metro_resident (bool, optional): Whether the taxpayer resides in a metro area. Defaults to True.
-        employment_type (EmploymentType, optional): Employment type. Defaults to EmploymentType.PRIVATE.
-
-    Raises:
-        TaxCalculationException: If the age is invalid.
-        TaxCalculationException: If the financial year is not supported.
-    """
-    self.age = _validate_non_negative("age", age)
-    self.financial_year = _validate_non_negative("financial_year", financial_year)
-    self.is_metro_resident = is_metro_resident
-    self.employment_type = employment_type
 
-    if self.age not in list(range(18,101,1)):
-      raise TaxCalculationException("invalid age")
-    if self.financial_year not in list(range(2025,2051,1)):
-      raise TaxCalculationException("module does not support tax calculation for financial years prior to 2025")
+  Args:
+      age (int): Age of the taxpayer.
+      financial_year (int): Financial year for tax calculation.
+      is_metro_resident (bool, optional): Whether the taxpayer resides in a metro area. Defaults to True.
+      employment_type (EmploymentType, optional): Employment type. Defaults to EmploymentType.PRIVATE.
+
+  Raises:
+      TaxCalculationException: If the age is invalid.
+      TaxCalculationException: If the financial year is not supported.
+  """
+  age: int
+  financial_year: int = 2025
+  is_metro_resident: bool = True
+  employment_type: EmploymentType = EmploymentType.PRIVATE
+
+  def __post_init__(self):
+    age = _validate_non_negative("age", self.age)
+    financial_year = _validate_non_negative("financial_year", self.financial_year)
+
+    # _validate_non_negative returns an int for whole numbers, so a float here
+    # is fractional and never hashes equal to a member of the int sets
+    if age not in _VALID_AGES:
+      raise TaxCalculationException(_ERR_AGE)
+    if financial_year not in _VALID_YEARS:
+      raise TaxCalculationException(_ERR_YEAR)
+
+    object.__setattr__(self, "age", age)
+    object.__setattr__(self, "financial_year", financial_year)
 
   
+@dataclass(frozen=True, slots=True, eq=False)
 class SalaryIncome:
   """Salary income details for the taxpayer.
-  """  
-  def __init__(self,basic_and_da=0,hra=0,other_allowances=0,bonus_and_commissions=0):
-    """Initialize salary income details for the taxpayer.
 
-    Args:
-        basic_and_da (int, optional): Basic salary and DA. Defaults to 0.
-        hra (int, optional): House Rent Allowance. Defaults to 0.
-        other_allowances (int, optional): Other allowances. Defaults to 0.
-        bonus_and_commissions (int, optional): Bonus and commissions. Defaults to 0.
-    """      
-    self.basic_and_da=_validate_non_negative("basic_and_da", basic_and_da)
-    self.hra=_validate_non_negative("hra", hra)
-    self.other_allowances=_validate_non_negative("other_allowances", other_allowances)
-    self.bonus_and_commissions=_validate_non_negative("bonus_and_commissions", bonus_and_commissions)
+  Args:
+      basic_and_da (int, optional): Basic salary and DA. Defaults to 0.
+      hra (int, optional): House Rent Allowance. Defaults to 0.
+      other_allowances (int, optional): Other allowances. Defaults to 0.
+      bonus_and_commissions (int, optional): Bonus and commissions. Defaults to 0.
 
-  @property
-  def total(self):
-    """Get the total salary income.
+  Attributes:
+      total (int): The total salary income, computed at construction.
+  """  
+  basic_and_da: int = 0
+  hra: int = 0
+  other_allowances: int = 0
+  bonus_and_commissions: int = 0
+  total: int = field(init=False, repr=False)
+
+  def __post_init__(self):
+    # each field checked in line rather than through _validate_amount_fields:
+    # valid ints, the common case, skip the validator call and the store
+    basic_and_da = self.basic_and_da
+    if type(basic_and_da) is not int or basic_and_da < 0:
+      basic_and_da = _validate_non_negative("basic_and_da", basic_and_da)
+      object.__setattr__(self, "basic_and_da", basic_and_da)
+    hra = self.hra
+    if type(hra) is not int or hra < 0:
+      hra = _validate_non_negative("hra", hra)
+      object.__setattr__(self, "hra", hra)
+    other_allowances = self.other_allowances
+    if type(other_allowances) is not int or other_allowances < 0:
+      other_allowances = _validate_non_negative("other_allowances", other_allowances)
+      object.__setattr__(self, "other_allowances", other_allowances)
+    bonus_and_commissions = self.bonus_and_commissions
+    if type(bonus_and_commissions) is not int or bonus_and_commissions < 0:
+      bonus_and_commissions = _validate_non_negative("bonus_and_commissions", bonus_and_commissions)
+      object.__setattr__(self, "bonus_and_commissions", bonus_and_commissions)
+    object.__setattr__(self, "total", basic_and_da + hra + other_allowances + bonus_and_commissions)
+
+  @classmethod
+  def from_arrays(cls, arrays: Mapping[str, Sequence[float]]) -> "ModelBatch":
+    """Build salary incomes for many taxpayers at once, one column per field.
 
     Returns:
-        int: The total salary income.
-    """    
-    return (
-        self.basic_and_da
-        + self.hra
-        + self.other_allowances
-        + self.bonus_and_commissions
-    )
+        ModelBatch: Columns for each field plus a ``total`` column.
+    """
+    return _batch_from_arrays(cls, arrays, {
+      "total": (("basic_and_da", 1.0), ("hra", 1.0), ("other_allowances", 1.0), ("bonus_and_commissions", 1.0)),
+    })
   
-  @property
-  def total_eligible_hra(self, settings: TaxSettings): 
+  def total_eligible_hra(self, settings: TaxSettings):
       """Get the total eligible HRA for the taxpayer.
 
+      Args:
+          settings (TaxSettings): Tax settings; metro residents are eligible for 50% of HRA, others 40%.
+
       Returns:
-          int: The total eligible HRA.
+          float: The total eligible HRA.
       """
-      if settings.is_metro_resident:
-          return self.hra * 0.5
-      return self.hra * 0.4
+      # bool(): is_metro_resident is not validated, so treat it as a truth value like the old if/else did
+      return self.hra * _HRA_FACTORS[bool(settings.is_metro_resident)]
 
+@dataclass(frozen=True, slots=True, eq=False)
 class BusinessIncome:
   """Business income details for the taxpayer.
-  """  
-  def __init__(self,business_income=0,property_income=0):
-    """Initialize business income details for the taxpayer.
 
-    Args:
-        business_income (int, optional): Business income. Defaults to 0.
-        property_income (int, optional): Property income. Defaults to 0.
-    """      
-    self.business_income=_validate_non_negative("business_income", business_income)
-    self.property_income=_validate_non_negative("property_income", property_income)
+  Args:
+      business_income (int, optional): Business income. Defaults to 0.
+      property_income (int, optional): Property income. Defaults to 0.
 
-  @property
-  def total(self):
-    """Get the total business income.
+  Attributes:
+      total (int): The total business income, computed at construction.
+  """  
+  business_income: int = 0
+  property_income: int = 0
+  total: int = field(init=False, repr=False)
+
+  def __post_init__(self):
+    business_income = self.business_income
+    if type(business_income) is not int or business_income < 0:
+      business_income = _validate_non_negative("business_income", business_income)
+      object.__setattr__(self, "business_income", business_income)
+    property_income = self.property_income
+    if type(property_income) is not int or property_income < 0:
+      property_income = _validate_non_negative("property_income", property_income)
+      object.__setattr__(self, "property_income", property_income)
+    object.__setattr__(self, "total", business_income + property_income)
+
+  @classmethod
+  def from_arrays(cls, arrays: Mapping[str, Sequence[float]]) -> "ModelBatch":
+    """Build business incomes for many taxpayers at once, one column per field.
 
     Returns:
-        int: The total business income.
-    """    
-    return (
-        self.business_income
-        + self.property_income
-    )
+        ModelBatch: Columns for each field plus a ``total`` column.
+    """
+    return _batch_from_arrays(cls, arrays, {
+      "total": (("business_income", 1.0), ("property_income", 1.0)),
+    })
   
+# (field, rate) of the capital gains taxed at a flat rate, in the order
+# CapitalGainsIncome.total_capital_gains_tax sums them; keep in step with it
+_CG_TAX_RATES = (
+  ("short_term_at_20_percent", 0.2),
+  ("long_term_at_12_5_percent", 0.125),
+  ("long_term_at_20_percent", 0.2),
+)
+
+@dataclass(frozen=True, slots=True, eq=False)
 class CapitalGainsIncome:
   """Capital gains income details for the taxpayer.
-  """  
-  def __init__(self, short_term_at_normal = 0, short_term_at_20_percent = 0, long_term_at_12_5_percent = 0, long_term_at_20_percent = 0):
-    """Initialize capital gains income details for the taxpayer.
-
-    Args:
-        short_term_at_normal (int): Short-term capital gains taxed at normal rates.
-        short_term_at_20_percent (int): Short-term capital gains taxed at 20%.
-        long_term_at_12_5_percent (int): Long-term capital gains taxed at 12.5%.
-        long_term_at_20_percent (int): Long-term capital gains taxed at 20%.
-    """
-    self.short_term_at_normal = _validate_non_negative("short_term_at_normal", short_term_at_normal)
-    self.short_term_at_20_percent = _validate_non_negative("short_term_at_20_percent", short_term_at_20_percent)
-    self.long_term_at_12_5_percent = _validate_non_negative("long_term_at_12_5_percent", long_term_at_12_5_percent)
-    self.long_term_at_20_percent = _validate_non_negative("long_term_at_20_percent", long_term_at_20_percent)
 
-  @property
-  def total(self):
-    """Get the total capital gains income.
+  Args:
+      short_term_at_normal (int): Short-term capital gains taxed at normal rates.
+      short_term_at_20_percent (int): Short-term capital gains taxed at 20%.
+      long_term_at_12_5_percent (int): Long-term capital gains taxed at 12.5%.
+      long_term_at_20_percent (int): Long-term capital gains taxed at 20%.
+
+  Attributes:
+      total (int): The total capital gains income, computed at construction.
+      total_capital_gains_tax (float): The total capital gains tax, computed at construction.
+  """
+  short_term_at_normal: int = 0
+  short_term_at_20_percent: int = 0
+  long_term_at_12_5_percent: int = 0
+  long_term_at_20_percent: int = 0
+  total: int = field(init=False, repr=False)
+  total_capital_gains_tax: float = field(init=False, repr=False)
+
+  def __post_init__(self):
+    short_term_at_normal = self.short_term_at_normal
+    if type(short_term_at_normal) is not int or short_term_at_normal < 0:
+      short_term_at_normal = _validate_non_negative("short_term_at_normal", short_term_at_normal)
+      object.__setattr__(self, "short_term_at_normal", short_term_at_normal)
+    short_term_at_20_percent = self.short_term_at_20_percent
+    if type(short_term_at_20_percent) is not int or short_term_at_20_percent < 0:
+      short_term_at_20_percent = _validate_non_negative("short_term_at_20_percent", short_term_at_20_percent)
+      object.__setattr__(self, "short_term_at_20_percent", short_term_at_20_percent)
+    long_term_at_12_5_percent = self.long_term_at_12_5_percent
+    if type(long_term_at_12_5_percent) is not int or long_term_at_12_5_percent < 0:
+      long_term_at_12_5_percent = _validate_non_negative("long_term_at_12_5_percent", long_term_at_12_5_percent)
+      object.__setattr__(self, "long_term_at_12_5_percent", long_term_at_12_5_percent)
+    long_term_at_20_percent = self.long_term_at_20_percent
+    if type(long_term_at_20_percent) is not int or long_term_at_20_percent < 0:
+      long_term_at_20_percent = _validate_non_negative("long_term_at_20_percent", long_term_at_20_percent)
+      object.__setattr__(self, "long_term_at_20_percent", long_term_at_20_percent)
+    object.__setattr__(self, "total", (
+      short_term_at_normal + short_term_at_20_percent + long_term_at_12_5_percent + long_term_at_20_percent
+    ))
+    object.__setattr__(self, "total_capital_gains_tax", (
+      short_term_at_20_percent * 0.2 + long_term_at_12_5_percent * 0.125 + long_term_at_20_percent * 0.2
+    ))
+
+  @classmethod
+  def from_arrays(cls, arrays: Mapping[str, Sequence[float]]) -> "ModelBatch":
+    """Build capital gains for many taxpayers at once, one column per field.
 
     Returns:
-        int: The total capital gains income.
+        ModelBatch: Columns for each field plus ``total`` and ``total_capital_gains_tax`` columns.
     """
-    return ( 
-      self.short_term_at_normal
-          + self.short_term_at_20_percent
-          + self.long_term_at_12_5_percent
-          + self.long_term_at_20_percent
-    )
-
-  @property
-  def total_capital_gains_tax(self):
-    """Calculate the total capital gains tax.
-
-    Returns:
-        float: The total capital gains tax.
-    """    
-    return (
-      self.short_term_at_20_percent * 0.2
-          + self.long_term_at_12_5_percent * 0.125
-          + self.long_term_at_20_percent * 0.2
-    )
-
+    return _batch_from_arrays(cls, arrays, {
+      "total": (
+        ("short_term_at_normal", 1.0), ("short_term_at_20_percent", 1.0),
+        ("long_term_at_12_5_percent", 1.0), ("long_term_at_20_percent", 1.0),
+      ),
+      "total_capital_gains_tax": _CG_TAX_RATES,
+    })
+
+@dataclass(frozen=True, slots=True, eq=False)
 class OtherIncome:
   """Other income details for the taxpayer.
-  """  
-  def __init__(self,savings_account_interest=0,fixed_deposit_interest=0,other_sources=0):
-    """Initialize other income details for the taxpayer.
 
-    Args:
-        savings_account_interest (int, optional): Savings account interest. Defaults to 0.
-        fixed_deposit_interest (int, optional): Fixed deposit interest. Defaults to 0.
-        other_sources (int, optional): Other sources of income. Defaults to 0.
+  Args:
+      savings_account_interest (int, optional): Savings account interest. Defaults to 0.
+      fixed_deposit_interest (int, optional): Fixed deposit interest. Defaults to 0.
+      other_sources (int, optional): Other sources of income. Defaults to 0.
+
+  Attributes:
+      total (int): The total other income, computed at construction.
+  """
+  savings_account_interest: int = 0
+  fixed_deposit_interest: int = 0
+  other_sources: int = 0
+  total: int = field(init=False, repr=False)
+
+  def __post_init__(self):
+    savings_account_interest = self.savings_account_interest
+    if type(savings_account_interest) is not int or savings_account_interest < 0:
+      savings_account_interest = _validate_non_negative("savings_account_interest", savings_account_interest)
+      object.__setattr__(self, "savings_account_interest", savings_account_interest)
+    fixed_deposit_interest = self.fixed_deposit_interest
+    if type(fixed_deposit_interest) is not int or fixed_deposit_interest < 0:
+      fixed_deposit_interest = _validate_non_negative("fixed_deposit_interest", fixed_deposit_interest)
+      object.__setattr__(self, "fixed_deposit_interest", fixed_deposit_interest)
+    other_sources = self.other_sources
+    if type(other_sources) is not int or other_sources < 0:
+      other_sources = _validate_non_negative("other_sources", other_sources)
+      object.__setattr__(self, "other_sources", other_sources)
+    object.__setattr__(self, "total", savings_account_interest + fixed_deposit_interest + other_sources)
+
+  @classmethod
+  def from_arrays(cls, arrays: Mapping[str, Sequence[float]]) -> "ModelBatch":
+    """Build other incomes for many taxpayers at once, one column per field.
+
+    Returns:
+        ModelBatch: Columns for each field plus a ``total`` column.
     """
-    self.savings_account_interest=_validate_non_negative("savings_account_interest", savings_account_interest)
-    self.fixed_deposit_interest=_validate_non_negative("fixed_deposit_interest", fixed_deposit_interest)
-    self.other_sources=_validate_non_negative("other_sources", other_sources)
+    return _batch_from_arrays(cls, arrays, {
+      "total": (("savings_account_interest", 1.0), ("fixed_deposit_interest", 1.0), ("other_sources", 1.0)),
+    })
+
+# fields summed by Deductions.total, in summation order; keep in step with it
+_DEDUCTION_TOTAL_FIELDS = (
+  "section_80c", "section_80d", "section_80dd", "section_24b", "section_80ccd_1b",
+  "section_80eea", "section_80u", "section_80eeb", "section_80e", "section_80g_50percent",
+  "section_80g_100percent", "section_80gga", "section_80ggc", "section_80tta", "section_80ttb",
+  "professional_tax", "food_coupons", "other_exemption",
+)
+
+@lru_cache(maxsize=None)
+def _deduction_row_layout():
+  """Return (caps, weights) aligned with Deductions.to_array(), built once.
+
+  Uncapped fields get an infinite cap; fields left out of Deductions.total get weight 0.
+  """
+  amount_fields = _amount_fields(Deductions)
+  kernels = batch_kernels()
+  caps = kernels.as_float_array([cap for _, cap in amount_fields])
+  weights = kernels.as_float_array([1.0 if name in _DEDUCTION_TOTAL_FIELDS else 0.0 for name, _ in amount_fields])
+  return caps, weights
+
+@dataclass(slots=True, eq=False)
+class Deductions:
+  """Deduction details for a taxpayer under the **Old Tax Regime (FY 2024–25 / AY 2025–26)**.
 
-  @property
-  def total(self):
-    """Get the total other income.
+  All amounts should be provided in INR. The calculator will automatically
+  apply statutory limits wherever applicable.
 
-    Returns:
-        int: The total other income.
-    """    
-    return (
-        self.savings_account_interest
-        + self.fixed_deposit_interest
-        + self.other_sources
-    )
+  Args:
+      section_80c (int, optional):
+          Investments and expenses eligible under Section 80C such as EPF, PPF,
+          ELSS, Life Insurance Premium, Tuition Fees, Principal repayment of
+          home loan, etc.
+          Maximum deduction allowed: ₹1,50,000 (combined cap under 80C).
+
+      section_80d (int, optional):
+          Health insurance premium paid for self, spouse, children, and parents.
+          Includes preventive health check-ups.
+          Maximum allowed:
+          - ₹25,000 for self/family
+          - Additional ₹25,000 for parents
+          - Up to ₹50,000 if parents are senior citizens
+          Overall cap considered by calculator: ₹1,00,000.
+
+      section_80gg (int, optional):
+          Deduction for rent paid when HRA is not received.
+          Applicable only if taxpayer, spouse, or minor child does not own
+          residential property at the place of employment.
+          Actual eligible amount is calculated as per rules (₹5,000 per month max).
+
+      section_80dd (int, optional):
+          Deduction for maintenance and medical treatment of a dependent
+          with disability.
+          - ₹75,000 for normal disability
+          - ₹1,25,000 for severe disability (≥80%).
+
+      section_80ddb (int, optional):
+          Medical treatment expenses for specified critical illnesses
+          for self or dependents.
+          Maximum allowed:
+          - ₹40,000 (non-senior citizens)
+          - ₹1,00,000 (senior citizens).
+
+      section_24b (int, optional):
+          Interest paid on home loan for self-occupied property.
+          Maximum deduction allowed: ₹2,00,000.
+
+      section_80ccd_1b (int, optional):
+          Additional contribution to National Pension System (NPS – Tier I).
+          Over and above Section 80C limit.
+          Maximum additional deduction: ₹50,000.
+
+      section_80ccd_2 (int, optional):
+          Employer’s contribution to NPS.
+          Deduction allowed up to 10% of basic salary + DA (14% for government employees).
+          This is over and above Section 80C and 80CCD(1B).
+
+      section_80eea (int, optional):
+          Interest on home loan for affordable housing (sanctioned before
+          31 March 2022).
+          Maximum additional deduction: ₹1,50,000.
+
+      section_80u (int, optional):
+          Deduction for a resident individual with disability.
+          - ₹75,000 for normal disability
+          - ₹1,25,000 for severe disability.
+
+      section_80eeb (int, optional):
+          Interest paid on loan taken for purchase of an electric vehicle.
+          Maximum deduction allowed: ₹1,50,000.
+
+      section_80e (int, optional):
+          Interest paid on education loan for higher studies
+          (self, spouse, children).
+          No upper monetary limit.
+          Deduction available for up to 8 consecutive assessment years.
+
+      section_80g_50percent (int, optional):
+          Donations made to approved charitable institutions
+          eligible for 50% deduction (with or without qualifying limit,
+          as applicable).
+
+      section_80g_100percent (int, optional):
+          Donations made to approved funds eligible for 100% deduction
+          (subject to conditions).
+
+      section_80gga (int, optional):
+          Donations for scientific research or rural development.
+          No deduction allowed if taxpayer has business/professional income.
+
+      section_80ggc (int, optional):
+          Donations made to political parties or electoral trusts.
+          No maximum limit, but cash donations are not allowed.
+
+      rent_for_hra_exemption (int, optional):
+          Rent paid for claiming HRA exemption.
+          Actual exemption is calculated separately based on salary,
+          rent paid, and city of residence.
+
+      professional_tax (int, optional):
+          Professional tax paid to state government.
+          Maximum deduction allowed: ₹2,500.
+
+      food_coupons (int, optional):
+          Meal vouchers/food coupons (e.g., Sodexo).
+          Tax-exempt up to ₹2,200 per month (₹26,400 annually).
+
+      other_exemption (int, optional):
+          Any other exemptions allowed under salary (if applicable).
+          No predefined statutory limit.
+  """
+  section_80c: int = field(default=0, metadata={"cap": 150000})
+  section_80d: int = field(default=0, metadata={"cap": 100000})
+  section_80gg: int = 0 # calculated based on settings
+  section_80dd: int = field(default=0, metadata={"cap": 1250000})
+  section_80ddb: int = 0
+  section_24b: int = field(default=0, metadata={"cap": 200000})
+  section_80ccd_1b: int = field(default=0, metadata={"cap": 50000})
+  section_80ccd_2: int = 0 #TODO: implement logic for section 80CCD(2) based on employer contribution
+  section_80eea: int = field(default=0, metadata={"cap": 150000})
+  section_80u: int = field(default=0, metadata={"cap": 125000})
+  section_80eeb: int = field(default=0, metadata={"cap": 150000})
+  section_80e: int = 0 #no limit
+  section_80g_50percent: int = 0 #no limit
+  section_80g_100percent: int = 0 #no limit
+  section_80gga: int = 0 #no limit
+  section_80ggc: int = 0 #no limit
+  rent_for_hra_exemption: int = 0 # calculated based on settings
+  professional_tax: int = field(default=0, metadata={"cap": 2500})
+  food_coupons: int = field(default=0, metadata={"cap": 26400})
+  other_exemption: int = 0 #no limit
+  # derived from savings interest by the calculator; assign through _cap_nonneg
+  section_80tta: int = field(default=0, init=False)
+  section_80ttb: int = field(default=0, init=False)
+
+  def __post_init__(self):
+    _validate_amount_fields(self)
+
+  @classmethod
+  def from_arrays(cls, arrays: Mapping[str, Sequence[float]]) -> "ModelBatch":
+    """Build deductions for many taxpayers at once, one column per field.
+
+    The same statutory caps as the constructor are applied to every row.
+    80TTA/80TTB are derived by the calculator and are not part of the batch.
 
-class Deductions:
-  """Deduction details for the taxpayer.
-  """  
-  def __init__(self,
-               section_80c=0,
-               section_80d=0,
-               section_80gg=0,
-               section_80dd=0,
-               section_80ddb=0,
-               section_24b=0,
-               section_80ccd_1b=0,
-               section_80ccd_2=0,
-               section_80eea=0,
-               section_80u=0,
-               section_80eeb=0,
-               section_80e=0,
-               section_80g_50percent=0,
-               section_80g_100percent=0,
-               section_80gga=0,
-               section_80ggc=0,
-               rent_for_hra_exemption=0,
-               professional_tax=0,
-               food_coupons=0,
-               other_exemption=0):
+    Returns:
+        ModelBatch: Columns for each field plus a ``total`` column matching Deductions.total.
     """
-    Deduction details for a taxpayer under the **Old Tax Regime (FY 2024–25 / AY 2025–26)**.
+    return _batch_from_arrays(cls, arrays, {
+      "total": tuple(
+        (name, 1.0) for name in _DEDUCTION_TOTAL_FIELDS if name not in ("section_80tta", "section_80ttb")
+      ),
+    })
 
-    All amounts should be provided in INR. The calculator will automatically
-    apply statutory limits wherever applicable.
+  def to_array(self):
+    """Return the constructor fields as one row, in declaration order.
 
-    Args:
-        section_80c (int, optional):
-            Investments and expenses eligible under Section 80C such as EPF, PPF,
-            ELSS, Life Insurance Premium, Tuition Fees, Principal repayment of
-            home loan, etc.
-            Maximum deduction allowed: ₹1,50,000 (combined cap under 80C).
-
-        section_80d (int, optional):
-            Health insurance premium paid for self, spouse, children, and parents.
-            Includes preventive health check-ups.
-            Maximum allowed:
-            - ₹25,000 for self/family
-            - Additional ₹25,000 for parents
-            - Up to ₹50,000 if parents are senior citizens
-            Overall cap considered by calculator: ₹1,00,000.
-
-        section_80gg (int, optional):
-            Deduction for rent paid when HRA is not received.
-            Applicable only if taxpayer, spouse, or minor child does not own
-            residential property at the place of employment.
-            Actual eligible amount is calculated as per rules (₹5,000 per month max).
-
-        section_80dd (int, optional):
-            Deduction for maintenance and medical treatment of a dependent
-            with disability.
-            - ₹75,000 for normal disability
-            - ₹1,25,000 for severe disability (≥80%).
-
-        section_80ddb (int, optional):
-            Medical treatment expenses for specified critical illnesses
-            for self or dependents.
-            Maximum allowed:
-            - ₹40,000 (non-senior citizens)
-            - ₹1,00,000 (senior citizens).
-
-        section_24b (int, optional):
-            Interest paid on home loan for self-occupied property.
-            Maximum deduction allowed: ₹2,00,000.
-
-        section_80ccd_1b (int, optional):
-            Additional contribution to National Pension System (NPS – Tier I).
-            Over and above Section 80C limit.
-            Maximum additional deduction: ₹50,000.
-
-        section_80ccd_2 (int, optional):
-            Employer’s contribution to NPS.
-            Deduction allowed up to 10% of basic salary + DA (14% for government employees).
-            This is over and above Section 80C and 80CCD(1B).
-
-        section_80eea (int, optional):
-            Interest on home loan for affordable housing (sanctioned before
-            31 March 2022).
-            Maximum additional deduction: ₹1,50,000.
-
-        section_80u (int, optional):
-            Deduction for a resident individual with disability.
-            - ₹75,000 for normal disability
-            - ₹1,25,000 for severe disability.
-
-        section_80eeb (int, optional):
-            Interest paid on loan taken for purchase of an electric vehicle.
-            Maximum deduction allowed: ₹1,50,000.
-
-        section_80e (int, optional):
-            Interest paid on education loan for higher studies
-            (self, spouse, children).
-            No upper monetary limit.
-            Deduction available for up to 8 consecutive assessment years.
-
-        section_80g_50percent (int, optional):
-            Donations made to approved charitable institutions
-            eligible for 50% deduction (with or without qualifying limit,
-            as applicable).
-
-        section_80g_100percent (int, optional):
-            Donations made to approved funds eligible for 100% deduction
-            (subject to conditions).
-
-        section_80gga (int, optional):
-            Donations for scientific research or rural development.
-            No deduction allowed if taxpayer has business/professional income.
-
-        section_80ggc (int, optional):
-            Donations made to political parties or electoral trusts.
-            No maximum limit, but cash donations are not allowed.
-
-        rent_for_hra_exemption (int, optional):
-            Rent paid for claiming HRA exemption.
-            Actual exemption is calculated separately based on salary,
-            rent paid, and city of residence.
-
-        professional_tax (int, optional):
-            Professional tax paid to state government.
-            Maximum deduction allowed: ₹2,500.
-
-        food_coupons (int, optional):
-            Meal vouchers/food coupons (e.g., Sodexo).
-            Tax-exempt up to ₹2,200 per month (₹26,400 annually).
-
-        other_exemption (int, optional):
-            Any other exemptions allowed under salary (if applicable).
-            No predefined statutory limit.
+    Rows from several instances can be stacked and passed to total_batch.
     """
+    return batch_kernels().as_float_array([getattr(self, name) for name, _ in _amount_fields(Deductions)])
 
-    self.section_80c=min(_validate_non_negative("section_80c", section_80c),150000)
-    self.section_80d=min(_validate_non_negative("section_80d", section_80d), 100000)
-    self.section_80gg=_validate_non_negative("section_80gg", section_80gg) # calculated based on settings
-    self.section_80dd=min(_validate_non_negative("section_80dd", section_80dd), 1250000)
-    self.section_80ddb=_validate_non_negative("section_80ddb", section_80ddb)
-    self.section_24b=min(_validate_non_negative("section_24b", section_24b), 200000)
-    self.section_80ccd_1b=min(_validate_non_negative("section_80ccd_1b", section_80ccd_1b), 50000)
-    self.section_80ccd_2=_validate_non_negative("section_80ccd_2", section_80ccd_2) #TODO: implement logic for section 80CCD(2) based on employer contribution
-    self.section_80eea=min(_validate_non_negative("section_80eea", section_80eea), 150000)
-    self.section_80u=min(_validate_non_negative("section_80u", section_80u), 125000)
-    self.section_80eeb=min(_validate_non_negative("section_80eeb", section_80eeb), 150000)
-    self.section_80e=_validate_non_negative("section_80e", section_80e) #no limit
-    self.section_80g_50percent=_validate_non_negative("section_80g_50percent", section_80g_50percent) #no limit
-    self.section_80g_100percent=_validate_non_negative("section_80g_100percent", section_80g_100percent) #no limit
-    self.section_80gga=_validate_non_negative("section_80gga", section_80gga) #no limit
-    self.section_80ggc=_validate_non_negative("section_80ggc", section_80ggc) #no limit
-    self._section_80tta = 0
-    self._section_80ttb = 0
-    self.rent_for_hra_exemption=_validate_non_negative("rent_for_hra_exemption", rent_for_hra_exemption) # calculated based on settings
-    self.professional_tax=min(_validate_non_negative("professional_tax", professional_tax), 2500)
-    self.food_coupons=min(_validate_non_negative("food_coupons", food_coupons), 26400)
-    self.other_exemption=_validate_non_negative("other_exemption", other_exemption) #no limit
+  @classmethod
+  def total_batch(cls, rows: Sequence[Sequence[float]]):
+    """Compute Deductions.total for many taxpayers from a row-per-taxpayer matrix.
 
-  
-  @property
-  def section_80tta(self):
-    return self._section_80tta
+    Each row is laid out like to_array(). The statutory caps are applied
+    inside the kernel, so raw uncapped amounts may be passed. 80TTA/80TTB are
+    derived by the calculator and are not part of the row.
 
-  @section_80tta.setter
-  def section_80tta(self, value):
-    """Set section 80TTA value with basic validation (non-negative)."""
-    if value is None:
-      value = 0
-    if value < 0:
-      raise TaxCalculationException("section_80tta cannot be negative")
-    value = min(value, 10000)
-    self._section_80tta = value
+    Args:
+        rows (Sequence[Sequence[float]]): An (N, F) matrix, F being the number of constructor fields.
 
-  @property
-  def section_80ttb(self):
-    return self._section_80ttb
+    Raises:
+        ValueError: If a row does not have one value per constructor field.
+        TaxCalculationException: If any value is negative, NaN or not a number.
 
-  @section_80ttb.setter
-  def section_80ttb(self, value):
-    """Set section 80TTB value with basic validation (non-negative)."""
-    if value is None:
-      value = 0
-    if value < 0:
-      raise TaxCalculationException("section_80ttb cannot be negative")
-    value = min(value, 50000)
-    self._section_80ttb = value
+    Returns:
+        Sequence[float]: One total per row.
+    """
+    caps, weights = _deduction_row_layout()
+    kernels = batch_kernels()
+    out = kernels.float_zeros(len(rows))
+    if not len(rows):
+      return out
+    width_error = f"each row must have {len(caps)} values, ordered like Deductions.to_array()"
+    try:
+      matrix = kernels.as_float_matrix(rows)
+    except (TypeError, ValueError):
+      # only on failure: tell ragged rows apart from values that are not numbers
+      if any(len(row) != len(caps) for row in rows):
+        raise ValueError(width_error) from None
+      for i, row in enumerate(rows):
+        for (name, _), value in zip(_amount_fields(Deductions), row):
+          try:
+            float(value)
+          except (TypeError, ValueError):
+            raise TaxCalculationException(f"{name} in row {i} must be a number") from None
+      raise
+    if hasattr(matrix, "shape"):
+      well_formed = matrix.ndim == 2 and matrix.shape[1] == len(caps)
+    else:
+      well_formed = all(len(row) == len(caps) for row in matrix)
+    if not well_formed:
+      raise ValueError(width_error)
+    negative_at = kernels.capped_row_sums(matrix, caps, weights, out)
+    if negative_at >= 0:
+      raise TaxCalculationException(f"deductions in row {negative_at} must be non-negative numbers")
+    return out
 
   @property
   def total(self):
     """Calculate the total deductions.
 
+    Unlike the income models' ``total``, this is summed on every access: the
+    instance stays mutable because the calculator fills in 80TTA/80TTB after
+    construction, so a value cached in __post_init__ could go stale.
+
     Returns:
         int: Total deductions.
     """    
+    # spelled out rather than sum(attrgetter(...)(self)): on CPython 3.11+
+    # slot loads and int adds are cheaper than building the tuple
     return (
         self.section_80c
         + self.section_80d
@@ -405,7 +625,6 @@ class Deductions:
         + self.section_80g_100percent
         + self.section_80gga
         + self.section_80ggc
-        + self.section_80ggc
         + self.section_80tta
         + self.section_80ttb
         + self.professional_tax
@@ -413,3 +632,35 @@ class Deductions:
         + self.other_exemption
     )
 
+# eq=False: columns are arrays, so value equality and hashing are not meaningful
+@dataclass(frozen=True, slots=True, eq=False)
+class ModelBatch:
+  """Column-wise (struct of arrays) values of one model for many taxpayers.
+
+  Built by the ``from_arrays`` classmethod of SalaryIncome, BusinessIncome,
+  CapitalGainsIncome, OtherIncome and Deductions. Every field of the model and
+  every derived total is available as an attribute holding one column: a
+  float64 ndarray when numba is installed, otherwise a list of floats.
+  Batches pickle, so they can be sent to multiprocessing workers, and compare
+  and hash by identity.
+
+  Args:
+      model (type): The model class the columns belong to.
+      columns (Mapping[str, Sequence[float]]): Validated and capped input columns.
+      totals (Mapping[str, Sequence[float]]): Derived columns such as ``total``.
+  """
+  model: type
+  columns: Mapping[str, Any]
+  totals: Mapping[str, Any]
+
+  def __getattr__(self, name):
+    if name in ("model", "columns", "totals"):
+      # slots not yet filled (e.g. during copy); avoid recursing into ourselves
+      raise AttributeError(name)
+    for source in (self.columns, self.totals):
+      if name in source:
+        return source[name]
+    raise AttributeError(f"{self.model.__name__} batch has no field {name!r}")
+
+  def __len__(self):
+    return len(next(iter(self.columns.values()), ()))
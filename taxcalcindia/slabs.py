@@ -1,10 +1,17 @@
-from typing import Dict, List, Tuple, Union
+import math
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple, Union
 from types import MappingProxyType
 
+from ._kernels import as_float_array
+from .exceptions import DataNotFoundError
+
 
 Number = Union[int, float]
 Slab = Tuple[Number, float]
 
+SUPPORTED_FINANCIAL_YEARS = range(2025, 2051)
+
 def _base_slabs() -> Dict[str, List[Slab]]:
     """
     Declarative slab definitions. 
@@ -18,35 +25,67 @@ def _base_slabs() -> Dict[str, List[Slab]]:
             (1600000, 0.15),
             (2000000, 0.20),
             (2400000, 0.25),
-            (float("inf"), 0.30),
+            (math.inf, 0.30),
         ],
         "old_regime_general": [
             (250000, 0.0),
             (500000, 0.05),
             (1000000, 0.20),
-            (float("inf"), 0.30),
+            (math.inf, 0.30),
         ],
         "old_regime_senior": [
             (300000, 0.0),
             (500000, 0.05),
             (1000000, 0.20),
-            (float("inf"), 0.30),
+            (math.inf, 0.30),
         ],
         "old_regime_super_senior": [
             (500000, 0.0),
             (1000000, 0.20),
-            (float("inf"), 0.30),
+            (math.inf, 0.30),
         ],
     }
 
+@lru_cache(maxsize=None)
 def get_tax_slabs(financial_year: Union[int, str] | None, age: int | None) -> Dict[str, List[Slab]]:
     """
     Return tax slabs for the given financial_year and age.
     Currently financial_year is accepted for future extensibility; all years
-    use the same base slabs. 
+    use the same base slabs. The result is read-only and cached per
+    (financial_year, age).
     """
     # Placeholder: adjust slabs based on financial_year if needed in future.
     slabs = _base_slabs()
 
     immutable = {k: tuple(v) for k, v in slabs.items()}
-    return MappingProxyType(immutable)
\ No newline at end of file
+    return MappingProxyType(immutable)
+
+def _build_tax_arrays() -> Dict[Tuple[int, str], Tuple[Any, Any]]:
+    """
+    Split every supported (financial_year, slab_key) table into (limits, rates)
+    columns in the float form consumed by the tax kernels.
+    """
+    tax_arrays = {}
+    for financial_year in SUPPORTED_FINANCIAL_YEARS:
+        for key, slab in get_tax_slabs(financial_year, None).items():
+            limits = as_float_array([limit for limit, _ in slab])
+            rates = as_float_array([rate for _, rate in slab])
+            tax_arrays[(financial_year, key)] = (limits, rates)
+    return tax_arrays
+
+_TAX_ARRAYS = _build_tax_arrays()
+
+def get_tax_arrays(financial_year: int, slab_key: str) -> Tuple[Any, Any]:
+    """
+    Return the precomputed (limits, rates) columns for one slab table, e.g.
+    get_tax_arrays(2025, "new_regime"). The tables are built once at import.
+
+    Raises:
+        DataNotFoundError: If there are no slabs for the financial year or key.
+    """
+    try:
+        return _TAX_ARRAYS[(financial_year, slab_key)]
+    except KeyError:
+        raise DataNotFoundError(
+            f"no tax slabs for financial year {financial_year} and slab {slab_key!r}"
+        ) from None
@@ -1,11 +1,14 @@
 import os
+import pickle
 import sys
 import unittest
+from dataclasses import FrozenInstanceError
 
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 
-from taxcalcindia.calculator import IncomeTaxCalculator
+from taxcalcindia.calculator import IncomeTaxCalculator, calculate_tax_batch
+from taxcalcindia.exceptions import TaxCalculationException
 from taxcalcindia.models import (
     SalaryIncome,
     BusinessIncome,
@@ -13,6 +16,9 @@ from taxcalcindia.models import (
     Deductions,
     TaxSettings,
     CapitalGainsIncome,
+    _DEDUCTION_TOTAL_FIELDS,
+    _CG_TAX_RATES,
+    _amount_fields,
 )
 
 
@@ -345,6 +351,265 @@ class TestIncomeTaxCalculator(unittest.TestCase):
       self.assertEqual(new_val, 0.0)
       self.assertEqual(old_val, 0.0)
 
+  @unittest.skipUnless(__debug__, "type checks are stripped under -O")
+  def test_bad_settings_type_checked_before_income_source(self):
+    with self.assertRaises(TypeError):
+      IncomeTaxCalculator("bad")
+
+  def test_missing_income_source_raises(self):
+    # runs with and without -O: the income source check is never stripped
+    with self.assertRaises(ValueError):
+      IncomeTaxCalculator(TaxSettings(age=30))
+
+  def test_reused_calculator_sees_reassigned_income(self):
+    calc = IncomeTaxCalculator(TaxSettings(age=30), SalaryIncome(basic_and_da=1000000))
+    calc.calculate_tax()
+    calc.salary = SalaryIncome(basic_and_da=3000000)
+    output = calc.calculate_tax(is_comparision_needed=False)
+    self.assertEqual(output["income_summary"]["gross_income"], 3000000)
+    self.assertEqual(output["tax_liability"]["new_regime"]["total"], 475800)
+
+  def test_income_fields_normalized_like_validator(self):
+    salary = SalaryIncome(basic_and_da=None, hra=50000.0, other_allowances="1200", bonus_and_commissions=True)
+    self.assertEqual(
+      (salary.basic_and_da, salary.hra, salary.other_allowances, salary.bonus_and_commissions), (0, 50000, 1200, 1)
+    )
+    self.assertIs(type(salary.hra), int)
+    self.assertEqual(salary.total, 51201)
+    for model in (SalaryIncome, BusinessIncome, CapitalGainsIncome, OtherIncome):
+      with self.assertRaises(TaxCalculationException, msg=model.__name__):
+        model(-1)
+      with self.assertRaises(TaxCalculationException, msg=model.__name__):
+        model("abc")
+
+  def test_models_use_slots(self):
+    models = (
+      TaxSettings(age=30),
+      SalaryIncome(),
+      BusinessIncome(),
+      CapitalGainsIncome(),
+      OtherIncome(),
+      Deductions(),
+    )
+    for model in models:
+      self.assertFalse(hasattr(model, "__dict__"), f"{type(model).__name__} should not carry a __dict__")
+
+  def test_models_compare_and_hash_by_identity(self):
+    for make in (
+      lambda: TaxSettings(age=30),
+      lambda: SalaryIncome(basic_and_da=500000),
+      lambda: BusinessIncome(),
+      lambda: CapitalGainsIncome(),
+      lambda: OtherIncome(),
+      lambda: Deductions(section_80c=1000),
+    ):
+      first, second = make(), make()
+      self.assertNotEqual(first, second)
+      self.assertEqual(first, first)
+      self.assertEqual(len({first, second}), 2)
+
+  def test_income_models_are_frozen(self):
+    # totals are computed once at construction, which is only safe while
+    # the fields cannot change afterwards
+    salary = SalaryIncome(basic_and_da=500000)
+    with self.assertRaises(FrozenInstanceError):
+      salary.basic_and_da = 600000
+    gains = CapitalGainsIncome(short_term_at_20_percent=100000)
+    with self.assertRaises(FrozenInstanceError):
+      gains.short_term_at_20_percent = 0
+    self.assertEqual(salary.total, 500000)
+    self.assertAlmostEqual(gains.total_capital_gains_tax, 20000.0)
+
+  def test_savings_interest_deduction_is_capped(self):
+    calc = IncomeTaxCalculator(
+      settings=TaxSettings(age=30),
+      other_income=OtherIncome(savings_account_interest=25000),
+    )
+    calc.calculate_tax()
+    self.assertEqual((calc.deductions.section_80tta, calc.deductions.section_80ttb), (10000, 0))
+
+    calc = IncomeTaxCalculator(
+      settings=TaxSettings(age=65),
+      other_income=OtherIncome(savings_account_interest=80000),
+    )
+    calc.calculate_tax()
+    self.assertEqual((calc.deductions.section_80tta, calc.deductions.section_80ttb), (0, 50000))
+
+  def test_income_totals_are_plain_attributes(self):
+    # stored in a slot at construction; reading them must not run a property
+    for model in (SalaryIncome, BusinessIncome, CapitalGainsIncome, OtherIncome):
+      self.assertNotIsInstance(model.total, property, model.__name__)
+      self.assertIn("total", model.__slots__, model.__name__)
+    self.assertIn("total_capital_gains_tax", CapitalGainsIncome.__slots__)
+
+  def test_capital_gains_tax_matches_rate_table(self):
+    for i, (name, rate) in enumerate(_CG_TAX_RATES):
+      amount = 10 ** (i + 5)
+      gains = CapitalGainsIncome(**{name: amount})
+      self.assertAlmostEqual(gains.total_capital_gains_tax, amount * rate, msg=name)
+
+  def test_total_eligible_hra(self):
+    salary = SalaryIncome(basic_and_da=600000, hra=200000)
+    self.assertEqual(salary.total_eligible_hra(TaxSettings(age=30, is_metro_resident=True)), 100000)
+    self.assertEqual(salary.total_eligible_hra(TaxSettings(age=30, is_metro_resident=False)), 80000)
+    # is_metro_resident is not validated; any value counts by its truthiness
+    self.assertEqual(salary.total_eligible_hra(TaxSettings(age=30, is_metro_resident=None)), 80000)
+    self.assertEqual(salary.total_eligible_hra(TaxSettings(age=30, is_metro_resident="yes")), 100000)
+
+  def test_from_arrays_matches_models(self):
+    deduction_rows = [
+      {"section_80c": 250000, "section_80d": 20000, "section_80ggc": 5000},
+      {"section_80c": 90000, "professional_tax": 4000, "food_coupons": 30000},
+      {"section_24b": 350000, "section_80e": 75000},
+    ]
+    columns = {
+      name: [row.get(name, 0) for row in deduction_rows]
+      for name in {name for row in deduction_rows for name in row}
+    }
+    batch = Deductions.from_arrays(columns)
+    self.assertEqual(len(batch), len(deduction_rows))
+    for i, row in enumerate(deduction_rows):
+      single = Deductions(**row)
+      self.assertAlmostEqual(float(batch.total[i]), single.total)
+      self.assertAlmostEqual(float(batch.section_80c[i]), single.section_80c)
+
+    gains = CapitalGainsIncome.from_arrays({
+      "short_term_at_20_percent": [200000, 0],
+      "long_term_at_12_5_percent": [350000, 25000],
+      "long_term_at_20_percent": [0, 5000],
+    })
+    self.assertAlmostEqual(float(gains.total_capital_gains_tax[0]), 83750.0)
+    self.assertAlmostEqual(float(gains.total_capital_gains_tax[1]), 4125.0)
+
+    # batches go to multiprocessing workers, so they must pickle
+    restored = pickle.loads(pickle.dumps(batch))
+    self.assertEqual([float(v) for v in restored.total], [float(v) for v in batch.total])
+    self.assertIs(restored.model, Deductions)
+    self.assertNotEqual(batch, Deductions.from_arrays(columns))
+    self.assertEqual(len({batch, gains}), 2)
+
+    with self.assertRaises(TaxCalculationException):
+      SalaryIncome.from_arrays({"basic_and_da": [100000, -1]})
+    with self.assertRaisesRegex(TaxCalculationException, "hra must be a number"):
+      SalaryIncome.from_arrays({"hra": [100000, "abc"]})
+    # NaN marks a missing value; it must not turn into the cap
+    for name in ("section_80c", "section_80e"):
+      with self.assertRaises(TaxCalculationException):
+        Deductions.from_arrays({name: [50000, float("nan")]})
+    with self.assertRaises(TypeError):
+      OtherIncome.from_arrays({"salary": [1]})
+
+  def test_deductions_total_batch_matches_models(self):
+    items = [
+      Deductions(section_80c=90000, section_80d=20000, section_80ggc=5000, section_80ddb=30000),
+      Deductions(section_24b=350000, section_80e=75000, food_coupons=30000),
+      Deductions(),
+    ]
+    totals = Deductions.total_batch([d.to_array() for d in items])
+    for i, d in enumerate(items):
+      self.assertAlmostEqual(float(totals[i]), d.total)
+
+    # raw rows are capped like the constructor caps them
+    raw = list(Deductions().to_array())
+    raw[0] = 250000
+    self.assertAlmostEqual(float(Deductions.total_batch([raw])[0]), Deductions(section_80c=250000).total)
+
+    for bad in (-1, float("nan")):
+      raw[0] = bad
+      with self.assertRaises(TaxCalculationException):
+        Deductions.total_batch([raw])
+    with self.assertRaises(ValueError):
+      Deductions.total_batch([raw[:-1]])
+    with self.assertRaises(ValueError):
+      Deductions.total_batch([list(items[0].to_array()), raw[:-1]])
+    raw[0] = "abc"
+    with self.assertRaisesRegex(TaxCalculationException, "section_80c"):
+      Deductions.total_batch([raw])
+
+    # an infinite amount in a column Deductions.total leaves out adds nothing
+    row = list(Deductions().to_array())
+    row[[name for name, _ in _amount_fields(Deductions)].index("section_80gg")] = float("inf")
+    self.assertEqual(float(Deductions.total_batch([row])[0]), Deductions(section_80gg=float("inf")).total)
+
+  def test_deductions_total_counts_80ggc_once(self):
+    deductions = Deductions(section_80c=100000, section_80ggc=20000)
+    self.assertEqual(deductions.total, 120000)
+
+    # every summed field counted exactly once
+    for name in _DEDUCTION_TOTAL_FIELDS:
+      deductions = Deductions()
+      setattr(deductions, name, 1)
+      self.assertEqual(deductions.total, 1, name)
+
+  def test_make_tax_fn_matches_calculator(self):
+    tax_fn = IncomeTaxCalculator.make_tax_fn(financial_year=2025, age=63)
+    for income in (500000, 1650000, 7500000, 65000000):
+      calc = IncomeTaxCalculator(
+        TaxSettings(age=63, financial_year=2025),
+        SalaryIncome(basic_and_da=income),
+        deductions=Deductions(section_80c=150000),
+      )
+      output = calc.calculate_tax(is_comparision_needed=False)
+      inc = output["income_summary"]
+      new_tax, old_tax = tax_fn(inc["new_regime_taxable_income"], inc["old_regime_taxable_income"])
+      self.assert_tax_liability(output, expected_new=new_tax, expected_old=old_tax)
+
+    # special rate gains are taxed at their flat rates, not the slabs
+    tax_fn = IncomeTaxCalculator.make_tax_fn(financial_year=2025, age=30)
+    for gains in (
+      CapitalGainsIncome(long_term_at_12_5_percent=1000000),
+      CapitalGainsIncome(short_term_at_normal=200000, short_term_at_20_percent=300000, long_term_at_20_percent=6000000),
+    ):
+      calc = IncomeTaxCalculator(TaxSettings(age=30), SalaryIncome(basic_and_da=3000000), capital_gains=gains)
+      output = calc.calculate_tax(is_comparision_needed=False)
+      inc = output["income_summary"]
+      new_tax, old_tax = tax_fn(inc["new_regime_taxable_income"], inc["old_regime_taxable_income"], gains)
+      self.assert_tax_liability(output, expected_new=new_tax, expected_old=old_tax)
+    self.assertEqual(
+      tax_fn(3925000, 3950000, CapitalGainsIncome(long_term_at_12_5_percent=1000000)), (605800, 855400)
+    )
+
+  def test_batch_matches_calculator(self):
+    rows = [
+      (0, 27, 0),
+      (1100000, 27, 0),
+      (1650000, 27, 150000),
+      (1650000, 63, 150000),
+      (1650000, 85, 150000),
+      (17500000, 50, 250000),
+      (65000000, 45, 0),
+    ]
+    incomes, ages, deductions = zip(*rows)
+
+    for parallel in (True, False):
+      new_tax, old_tax = calculate_tax_batch(incomes, ages, deductions, financial_year=2025, parallel=parallel)
+      for i, (income, age, deduction) in enumerate(rows):
+        settings = TaxSettings(age=age, financial_year=2025)
+        calc = IncomeTaxCalculator(
+          settings, SalaryIncome(basic_and_da=income), deductions=Deductions(other_exemption=deduction)
+        )
+        output = calc.calculate_tax(is_comparision_needed=False)
+        self.assert_tax_liability(output, expected_new=new_tax[i], expected_old=old_tax[i])
+
+  def test_batch_rejects_mismatched_lengths(self):
+    with self.assertRaises(ValueError):
+      calculate_tax_batch([1000000, 2000000], [30], [0, 0])
+
+  def test_batch_rejects_rows_the_calculator_rejects(self):
+    for income, age, deduction in (
+      (1500000, 5, 0),
+      (1500000, 30.5, 0),
+      (1500000, 30, -1000000),
+      (float("nan"), 30, 0),
+      (1500000, 30, float("nan")),
+    ):
+      with self.assertRaises(TaxCalculationException, msg=(income, age, deduction)):
+        calculate_tax_batch([1000000, income], [40, age], [0, deduction], parallel=False)
+
+  def test_batch_rejects_unsupported_financial_year(self):
+    with self.assertRaises(TaxCalculationException):
+      calculate_tax_batch([1000000], [30], [0], financial_year=2024)
+
 
 if __name__ == "__main__":
   unittest.main()
\ No newline at end of file